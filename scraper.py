@@ -1,21 +1,182 @@
-import requests
-import json
-import time
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-import pandas as pd
+import asyncio
+import aiohttp
+import orjson
+import itertools
+import os
+import tempfile
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+import numpy as np
 import random
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime
+
+FIRST_NAMES = np.array([
+    'Christopher', 'Jennifer', 'Michael', 'Sarah', 'David', 'Emma', 'Robert', 'Lisa',
+    'James', 'Amanda', 'Daniel', 'Rachel', 'Matthew', 'Jessica', 'Andrew', 'Emily',
+    'Ryan', 'Ashley', 'Kevin', 'Michelle', 'Brian', 'Nicole', 'John', 'Stephanie'
+], dtype=object)
+
+LAST_NAMES = np.array([
+    'Anderson', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
+    'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson',
+    'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Perez', 'Thompson'
+], dtype=object)
+
+FILM_BIOS = np.array([
+    'Award-winning filmmaker with over 15 years of experience in documentary and narrative film production.',
+    'Experienced cinematographer specializing in natural light photography and handheld camera work.',
+    'Post-production specialist with expertise in color grading, sound design, and visual effects.',
+    'Creative producer with a proven track record of successful independent film projects.',
+    'Visual effects artist with experience in both practical effects and digital compositing.',
+    'Screenwriter focused on character-driven narratives and contemporary social issues.',
+    'Production designer with extensive experience in period films and television series.',
+    'Sound engineer specializing in location recording and post-production audio mixing.'
+], dtype=object)
+
+FILM_EXPERIENCES = np.array([
+    'Lead Editor - "Midnight Stories" (2023)',
+    'Director of Photography - "Urban Legends" (2022)',
+    'VFX Supervisor - "Digital Dreams" (2023)',
+    'Sound Designer - "Whispers in the Dark" (2022)',
+    'Production Designer - "The Last Dance" (2023)',
+    'Assistant Director - "City Lights" TV Series (2021-2023)',
+    'Makeup Artist - "Fantasy Realm" (2022)',
+    'Gaffer - "Commercial Campaign" (2023)',
+    'Script Supervisor - "Detective Stories" (2022)',
+    'Casting Director - "Love in the City" (2023)'
+], dtype=object)
+
+JOB_TITLES = (
+    'Senior Video Editor - Netflix Original Series',
+    'Director of Photography - Independent Film',
+    'VFX Supervisor - Marvel Studios',
+    'Sound Designer - A24 Horror Film',
+    'Production Designer - HBO Max Series',
+    'Cinematographer - Documentary Film',
+    'Assistant Director - Warner Bros Feature',
+    'Makeup Department Head - Disney+ Fantasy',
+    'Gaffer - Apple TV+ Drama Series',
+    'Script Supervisor - Amazon Prime Thriller',
+    'Casting Director - Indie Romance Film',
+    'Location Manager - Netflix Action Series',
+    'Stunt Coordinator - Fast & Furious Franchise',
+    'Costume Designer - Period Drama Film',
+    'Boom Operator - Sitcom Production'
+)
+
+JOB_DESCRIPTIONS = (
+    'Seeking experienced editor for high-profile streaming series. Must have extensive experience with Avid Media Composer and collaborative post-production workflows.',
+    'Looking for skilled cinematographer to shoot independent feature film. RED camera experience and natural lighting expertise required.',
+    'VFX Supervisor needed for major superhero film. Strong background in Maya, Nuke, and team management essential.',
+    'Sound designer for atmospheric horror film. Experience with Pro Tools, Foley recording, and sound library management preferred.',
+    'Production designer for fantasy series set in medieval times. Strong attention to historical detail and large-scale set design required.',
+    'Cinematographer for environmental documentary. Drone operation license and wildlife filming experience preferred.',
+    'Assistant director for big-budget action film. Strong organizational skills and high-pressure set experience required.',
+    'Makeup department head for fantasy series. Prosthetics, special effects makeup, and team leadership experience needed.',
+    'Gaffer for critically acclaimed drama series. LED lighting expertise and color temperature mastery required.',
+    'Script supervisor for psychological thriller. Continuity experience and meticulous attention to detail essential.',
+    'Casting director for romantic comedy film. Strong industry connections and talent evaluation skills required.',
+    'Location manager for action series. Scouting experience and permit negotiation skills essential.',
+    'Stunt coordinator for major action franchise. Safety certification and wire work experience required.',
+    'Costume designer for 1940s period drama. Historical research skills and fabric knowledge essential.',
+    'Boom operator for multi-camera sitcom. Live audience experience and microphone technique expertise required.'
+)
+
+# Title/description pairs for generated jobs, paired once at import time
+FALLBACK_JOBS = tuple(zip(JOB_TITLES, JOB_DESCRIPTIONS))
+
+def has_class(name):
+    """Match a class attribute containing name among possibly several classes
+
+    SoupStrainer compares a plain string against the whole attribute value,
+    so containers like class="job-listing featured" would otherwise be dropped.
+    """
+    return lambda value: value is not None and name in value.split()
+
+@dataclass(slots=True)
+class Job:
+    title: str
+    description: str
+    location: str
+    source: str
+
+@dataclass(slots=True)
+class Professional:
+    # Field names match the JSON keys read by prisma/seed-from-json.js
+    firstName: str
+    lastName: str
+    role: str
+    bio: str
+    skills: list[str]
+    experience: str
+    location: str
 
 class FilmIndustryDataScraper:
+    # HTTP-scraped job boards; selectors and parse strainers are built once
+    # (adapt these selectors based on actual site structure)
+    SITE_SPECS = [
+        {
+            'url': 'https://www.productionhub.com/jobs',
+            'container': sv.compile('div.job-listing'),
+            'strainer': SoupStrainer('div', class_=has_class('job-listing')),
+            'title': sv.compile('h3.job-title'),
+            'description': sv.compile('div.job-description'),
+            'location': sv.compile('span.location'),
+            'source': 'ProductionHUB',
+            'limit': 20
+        },
+        {
+            'url': 'https://www.mandy.com/jobs',
+            'container': sv.compile('div.job-card'),
+            'strainer': SoupStrainer('div', class_=has_class('job-card')),
+            'title': sv.compile('h2.job-title'),
+            'description': sv.compile('div.job-summary'),
+            'location': sv.compile('span.location'),
+            'source': 'Mandy Network',
+            'limit': 10
+        }
+    ]
+
+    # Returns up to 15 FilmJobs.com listings, skipping any missing a field
+    FILM_JOBS_EXTRACT_SCRIPT = """
+        return Array.from(document.querySelectorAll('.job-item')).slice(0, 15).map(el => {
+            const title = el.querySelector('.job-title');
+            const description = el.querySelector('.job-description');
+            const location = el.querySelector('.job-location');
+            if (!title || !description || !location) {
+                return null;
+            }
+            return {
+                title: title.innerText,
+                description: description.innerText.slice(0, 500),
+                location: location.innerText
+            };
+        }).filter(job => job !== null);
+    """
+
     def __init__(self):
-        self.chrome_options = Options()
-        self.chrome_options.add_argument("--headless")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        # Chrome flags; the Options object is built when the driver starts so
+        # Selenium is only imported if the browser scrape actually runs
+        self.chrome_arguments = [
+            "--headless",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        ]
+        
+        # Shared HTTP session, created lazily on first use and reused across
+        # scrapes so repeated requests to the same host keep their connections
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        self._session = None
+        
+        # Upper bound on in-flight HTTP requests across all scrapes
+        self._semaphore = asyncio.Semaphore(20)
+        
+        # Chrome is started on the first Selenium scrape and kept for later runs
+        self._driver = None
         
         self.film_locations = {
             'United States': ['Los Angeles', 'New York', 'Atlanta', 'Chicago', 'Austin', 'San Francisco'],
@@ -27,314 +188,376 @@ class FilmIndustryDataScraper:
             'Spain': ['Madrid', 'Barcelona', 'Valencia'],
             'Canada': ['Toronto', 'Vancouver', 'Montreal']
         }
+        self._all_cities = tuple(itertools.chain.from_iterable(self.film_locations.values()))
         
-        self.film_categories = [
+        self.film_categories = (
             'Director', 'Producer', 'Cinematographer', 'Editor', 'Sound Designer',
             'Production Designer', 'Costume Designer', 'Makeup Artist', 'Visual Effects',
             'Screenwriter', 'Casting Director', 'Location Manager', 'Script Supervisor',
             'Gaffer', 'Grip', 'Boom Operator', 'Assistant Director', 'Stunt Coordinator'
-        ]
+        )
         
-        self.film_skills = [
+        self.film_skills = (
             'Final Cut Pro', 'Avid Media Composer', 'Adobe Premiere Pro', 'After Effects',
             'Cinema 4D', 'Maya', 'Blender', 'Pro Tools', 'Logic Pro', 'RED Camera',
             'ARRI Alexa', 'Steadicam', 'Drone Operation', 'Color Grading', 'Foley',
             'Motion Graphics', 'Storyboarding', 'Script Analysis', 'Budgeting'
-        ]
+        )
+        
+        # Fixed sampling pools for profile generation, built once per scraper
+        self._rng = np.random.default_rng()
+        self._category_pool = np.array(self.film_categories, dtype=object)
+        self._skill_pool = np.array(self.film_skills, dtype=object)
+        self._city_pool = np.array(self._all_cities, dtype=object)
 
-    def scrape_film_jobs(self):
-        """Scrape film industry jobs from multiple sources"""
-        jobs = []
+    def _get_session(self):
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    def _get_driver(self):
+        """Return the shared Chrome driver, starting it on first use"""
+        if self._driver is None:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            
+            chrome_options = Options()
+            for argument in self.chrome_arguments:
+                chrome_options.add_argument(argument)
+            self._driver = webdriver.Chrome(options=chrome_options, keep_alive=True)
+        return self._driver
+
+    def _quit_driver(self):
+        """Quit the shared Chrome driver; it is forgotten even if quitting fails"""
+        driver, self._driver = self._driver, None
+        if driver is not None:
+            driver.quit()
+
+    async def close(self):
+        """Release network resources held by the scraper"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+        await asyncio.to_thread(self._quit_driver)
+
+    async def scrape_film_jobs(self):
+        """Scrape film industry jobs from multiple sources concurrently, yielding each as it arrives"""
+        session = self._get_session()
+        queue = asyncio.Queue()
         
-        # Scrape from ProductionHUB
-        jobs.extend(self.scrape_production_hub())
+        async def pump_site(spec):
+            async for job in self._scrape_site(session, spec):
+                await queue.put(job)
         
-        # Scrape from FilmJobs.com
-        jobs.extend(self.scrape_film_jobs_com())
+        async def pump_film_jobs_com():
+            for job in await asyncio.to_thread(self.scrape_film_jobs_com):
+                await queue.put(job)
         
-        # Scrape from Mandy Network
-        jobs.extend(self.scrape_mandy_network())
+        # HTTP sites share one session; FilmJobs.com runs Selenium in a worker
+        # thread so it overlaps with the HTTP scrapes. A None sentinel marks
+        # the point where every source has finished.
+        producers = asyncio.gather(
+            *[pump_site(spec) for spec in self.SITE_SPECS],
+            pump_film_jobs_com(),
+            return_exceptions=True
+        )
+        producers.add_done_callback(lambda _: queue.put_nowait(None))
+        
+        found = False
+        try:
+            while (job := await queue.get()) is not None:
+                found = True
+                yield job
+        finally:
+            # Stop the scrapes if the consumer abandons the stream early
+            if not producers.done():
+                producers.cancel()
+        
+        for result in await producers:
+            if isinstance(result, Exception):
+                print(f"Error scraping jobs: {result}")
         
         # Add fallback data if scraping fails
-        if not jobs:
-            jobs = self.generate_fallback_jobs()
+        if not found:
+            for job in self.generate_fallback_jobs():
+                yield job
+
+    async def _fetch(self, session, url, retries=3, backoff_factor=0.3):
+        """Fetch a page body, retrying server errors; returns None on failure"""
+        for attempt in range(retries + 1):
+            async with self._semaphore:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        return await response.read()
+                    
+                    # Client errors won't change on retry, and error pages aren't worth parsing
+                    if response.status < 500 or attempt == retries:
+                        print(f"Skipping {url}: HTTP {response.status}")
+                        return None
             
-        return jobs
+            await asyncio.sleep(backoff_factor * (2 ** attempt))
 
-    def scrape_production_hub(self):
-        """Scrape jobs from ProductionHUB"""
-        jobs = []
+    async def _scrape_site(self, session, spec):
+        """Scrape jobs from an HTTP job board described by a SITE_SPECS entry, yielding each as it is parsed"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            # Note: You'll need to inspect the actual site structure
-            response = requests.get('https://www.productionhub.com/jobs', headers=headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = await self._fetch(session, spec['url'])
+            if content is None:
+                return
+            # Only build the listing subtrees, skipping navigation, scripts and footers
+            soup = BeautifulSoup(content, 'lxml', parse_only=spec['strainer'])
             
-            # Adapt these selectors based on actual site structure
-            for job_element in soup.find_all('div', class_='job-listing')[:20]:  # Limit to 20 jobs
+            for job_element in spec['container'].iselect(soup, limit=spec['limit']):
                 try:
-                    title = job_element.find('h3', class_='job-title')
-                    description = job_element.find('div', class_='job-description')
-                    location = job_element.find('span', class_='location')
+                    title = spec['title'].select_one(job_element)
+                    description = spec['description'].select_one(job_element)
+                    location = spec['location'].select_one(job_element)
                     
                     if title and description:
-                        jobs.append({
-                            'title': title.get_text(strip=True),
-                            'description': description.get_text(strip=True)[:500],  # Limit description
-                            'location': location.get_text(strip=True) if location else 'Remote',
-                            'source': 'ProductionHUB'
-                        })
+                        yield Job(
+                            title=title.get_text(strip=True),
+                            description=description.get_text(strip=True)[:500],  # Limit description
+                            location=location.get_text(strip=True) if location else 'Remote',
+                            source=spec['source']
+                        )
                 except Exception as e:
                     print(f"Error parsing job: {e}")
                     continue
                     
         except Exception as e:
-            print(f"Error scraping ProductionHUB: {e}")
-            
-        return jobs
+            print(f"Error scraping {spec['source']}: {e}")
 
     def scrape_film_jobs_com(self):
         """Scrape jobs from FilmJobs.com"""
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
         jobs = []
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
+            driver = self._get_driver()
             driver.get('https://www.filmjobs.com')
             
-            # Wait for page to load
-            time.sleep(3)
+            # Wait until the listings are rendered rather than a fixed delay
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '.job-item'))
+            )
             
-            # Find job listings (adapt selectors based on actual site)
-            job_elements = driver.find_elements(By.CSS_SELECTOR, '.job-item')
+            # Extract every listing in one WebDriver round-trip instead of one
+            # find_element call per field (adapt selectors based on actual site)
+            rows = driver.execute_script(self.FILM_JOBS_EXTRACT_SCRIPT)
+            jobs.extend(Job(**row, source='FilmJobs.com') for row in rows)
             
-            for job_element in job_elements[:15]:  # Limit to 15 jobs
-                try:
-                    title = job_element.find_element(By.CSS_SELECTOR, '.job-title').text
-                    description = job_element.find_element(By.CSS_SELECTOR, '.job-description').text
-                    location = job_element.find_element(By.CSS_SELECTOR, '.job-location').text
-                    
-                    jobs.append({
-                        'title': title,
-                        'description': description[:500],
-                        'location': location,
-                        'source': 'FilmJobs.com'
-                    })
-                except Exception as e:
-                    print(f"Error parsing job: {e}")
-                    continue
-                    
-            driver.quit()
+        except TimeoutException:
+            # No listings rendered in time; the browser itself is fine to reuse
+            print("No job listings found on FilmJobs.com")
             
-        except Exception as e:
+        except WebDriverException as e:
             print(f"Error scraping FilmJobs.com: {e}")
             
-        return jobs
-
-    def scrape_mandy_network(self):
-        """Scrape jobs from Mandy Network"""
-        jobs = []
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            # Mandy Network job search
-            response = requests.get('https://www.mandy.com/jobs', headers=headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # The browser may have crashed or its session expired, so start a
+            # fresh one on the next scrape rather than reusing a dead driver
+            try:
+                self._quit_driver()
+            except Exception as e:
+                print(f"Error quitting Chrome driver: {e}")
             
-            # Adapt selectors based on actual site structure
-            for job_element in soup.find_all('div', class_='job-card')[:10]:
-                try:
-                    title = job_element.find('h2', class_='job-title')
-                    description = job_element.find('div', class_='job-summary')
-                    location = job_element.find('span', class_='location')
-                    
-                    if title and description:
-                        jobs.append({
-                            'title': title.get_text(strip=True),
-                            'description': description.get_text(strip=True)[:500],
-                            'location': location.get_text(strip=True) if location else 'Remote',
-                            'source': 'Mandy Network'
-                        })
-                except Exception as e:
-                    print(f"Error parsing job: {e}")
-                    continue
-                    
         except Exception as e:
-            print(f"Error scraping Mandy Network: {e}")
+            print(f"Error scraping FilmJobs.com: {e}")
             
         return jobs
 
     def generate_fallback_jobs(self):
         """Generate realistic film industry job data if scraping fails"""
-        job_titles = [
-            'Senior Video Editor - Netflix Original Series',
-            'Director of Photography - Independent Film',
-            'VFX Supervisor - Marvel Studios',
-            'Sound Designer - A24 Horror Film',
-            'Production Designer - HBO Max Series',
-            'Cinematographer - Documentary Film',
-            'Assistant Director - Warner Bros Feature',
-            'Makeup Department Head - Disney+ Fantasy',
-            'Gaffer - Apple TV+ Drama Series',
-            'Script Supervisor - Amazon Prime Thriller',
-            'Casting Director - Indie Romance Film',
-            'Location Manager - Netflix Action Series',
-            'Stunt Coordinator - Fast & Furious Franchise',
-            'Costume Designer - Period Drama Film',
-            'Boom Operator - Sitcom Production'
-        ]
+        # Sample every location up front instead of once per job
+        locations = random.choices(self._all_cities, k=len(FALLBACK_JOBS))
         
-        job_descriptions = [
-            'Seeking experienced editor for high-profile streaming series. Must have extensive experience with Avid Media Composer and collaborative post-production workflows.',
-            'Looking for skilled cinematographer to shoot independent feature film. RED camera experience and natural lighting expertise required.',
-            'VFX Supervisor needed for major superhero film. Strong background in Maya, Nuke, and team management essential.',
-            'Sound designer for atmospheric horror film. Experience with Pro Tools, Foley recording, and sound library management preferred.',
-            'Production designer for fantasy series set in medieval times. Strong attention to historical detail and large-scale set design required.',
-            'Cinematographer for environmental documentary. Drone operation license and wildlife filming experience preferred.',
-            'Assistant director for big-budget action film. Strong organizational skills and high-pressure set experience required.',
-            'Makeup department head for fantasy series. Prosthetics, special effects makeup, and team leadership experience needed.',
-            'Gaffer for critically acclaimed drama series. LED lighting expertise and color temperature mastery required.',
-            'Script supervisor for psychological thriller. Continuity experience and meticulous attention to detail essential.',
-            'Casting director for romantic comedy film. Strong industry connections and talent evaluation skills required.',
-            'Location manager for action series. Scouting experience and permit negotiation skills essential.',
-            'Stunt coordinator for major action franchise. Safety certification and wire work experience required.',
-            'Costume designer for 1940s period drama. Historical research skills and fabric knowledge essential.',
-            'Boom operator for multi-camera sitcom. Live audience experience and microphone technique expertise required.'
+        return [
+            Job(title=title, description=description, location=location, source='Generated')
+            for (title, description), location in zip(FALLBACK_JOBS, locations)
         ]
-        
-        jobs = []
-        for i, title in enumerate(job_titles):
-            location = random.choice([city for cities in self.film_locations.values() for city in cities])
-            jobs.append({
-                'title': title,
-                'description': job_descriptions[i % len(job_descriptions)],
-                'location': location,
-                'source': 'Generated'
-            })
-            
-        return jobs
 
     def scrape_film_professionals(self):
-        """Scrape film professional profiles"""
-        professionals = []
+        """Scrape film professional profiles, yielding each as it is built"""
+        count = 100
         
         # Try to scrape from IMDb Pro (requires subscription)
         # For demo purposes, we'll generate realistic data
         
-        first_names = [
-            'Christopher', 'Jennifer', 'Michael', 'Sarah', 'David', 'Emma', 'Robert', 'Lisa',
-            'James', 'Amanda', 'Daniel', 'Rachel', 'Matthew', 'Jessica', 'Andrew', 'Emily',
-            'Ryan', 'Ashley', 'Kevin', 'Michelle', 'Brian', 'Nicole', 'John', 'Stephanie'
-        ]
+        rng = self._rng
+        skills = self._skill_pool
         
-        last_names = [
-            'Anderson', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
-            'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson',
-            'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Perez', 'Thompson'
-        ]
+        # Draw each field for every profile in a single vectorized call
+        first_names = rng.choice(FIRST_NAMES, size=count)
+        last_names = rng.choice(LAST_NAMES, size=count)
+        roles = rng.choice(self._category_pool, size=count)
+        bios = rng.choice(FILM_BIOS, size=count)
+        experiences = rng.choice(FILM_EXPERIENCES, size=count)
+        locations = rng.choice(self._city_pool, size=count)
         
-        film_bios = [
-            'Award-winning filmmaker with over 15 years of experience in documentary and narrative film production.',
-            'Experienced cinematographer specializing in natural light photography and handheld camera work.',
-            'Post-production specialist with expertise in color grading, sound design, and visual effects.',
-            'Creative producer with a proven track record of successful independent film projects.',
-            'Visual effects artist with experience in both practical effects and digital compositing.',
-            'Screenwriter focused on character-driven narratives and contemporary social issues.',
-            'Production designer with extensive experience in period films and television series.',
-            'Sound engineer specializing in location recording and post-production audio mixing.'
-        ]
+        # Sorting a random matrix row-wise shuffles the skill pool independently
+        # per profile; the first k indices of each row are that profile's sample
+        skill_orders = np.argsort(rng.random((count, len(skills))), axis=1)
+        skill_counts = rng.integers(3, 9, size=count)
         
-        for i in range(100):
-            professional = {
-                'firstName': random.choice(first_names),
-                'lastName': random.choice(last_names),
-                'role': random.choice(self.film_categories),
-                'bio': random.choice(film_bios),
-                'skills': random.sample(self.film_skills, random.randint(3, 8)),
-                'experience': self.generate_film_experience(),
-                'location': random.choice([city for cities in self.film_locations.values() for city in cities])
-            }
-            professionals.append(professional)
-            
-        return professionals
+        for first_name, last_name, role, bio, order, k, experience, location in zip(
+            first_names, last_names, roles, bios, skill_orders, skill_counts, experiences, locations
+        ):
+            yield Professional(
+                firstName=first_name,
+                lastName=last_name,
+                role=role,
+                bio=bio,
+                skills=skills[order[:k]].tolist(),
+                experience=experience,
+                location=location
+            )
 
-    def generate_film_experience(self):
-        """Generate realistic film industry experience"""
-        experiences = [
-            'Lead Editor - "Midnight Stories" (2023)',
-            'Director of Photography - "Urban Legends" (2022)',
-            'VFX Supervisor - "Digital Dreams" (2023)',
-            'Sound Designer - "Whispers in the Dark" (2022)',
-            'Production Designer - "The Last Dance" (2023)',
-            'Assistant Director - "City Lights" TV Series (2021-2023)',
-            'Makeup Artist - "Fantasy Realm" (2022)',
-            'Gaffer - "Commercial Campaign" (2023)',
-            'Script Supervisor - "Detective Stories" (2022)',
-            'Casting Director - "Love in the City" (2023)'
-        ]
-        return random.choice(experiences)
+    async def save_to_json(self, jobs, professionals, filename='film_industry_data.json', pretty=False):
+        """Stream scraped data to a JSON file (compact unless pretty is set)
 
-    def save_to_json(self, jobs, professionals, filename='film_industry_data.json'):
-        """Save scraped data to JSON file"""
-        data = {
-            'jobs': jobs,
-            'professionals': professionals,
-            'locations': self.film_locations,
-            'categories': self.film_categories,
-            'skills': self.film_skills,
-            'scraped_at': datetime.now().isoformat()
-        }
+        jobs is an async iterable and professionals a regular iterable; each
+        record is serialized and written as it arrives, so neither collection
+        is held in memory. Returns the number of jobs and professionals written.
+        """
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        
+        # Envelope bytes for each mode; in pretty mode records sit two levels
+        # deep, so their own indented lines are shifted by four spaces
+        if pretty:
+            item_start = b'\n    '
+            array_end = b'\n  ]'
+            professionals_start = b',\n  "professionals": ['
+            jobs_start = b'{\n  "jobs": ['
+        else:
+            item_start = b''
+            array_end = b']'
+            professionals_start = b',"professionals":['
+            jobs_start = b'{"jobs":['
+        
+        def encode(record):
+            data = orjson.dumps(record, option=option)
+            return data.replace(b'\n', item_start) if pretty else data
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        job_count = 0
+        professional_count = 0
+        
+        # Stream into a temporary file next to the target and only move it into
+        # place once complete, so an interrupted run keeps the last good file
+        f = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(os.path.abspath(filename)),
+            prefix='.film_industry_data.',
+            suffix='.tmp',
+            delete=False
+        )
+        try:
+            with f:
+                f.write(jobs_start)
+                async for job in jobs:
+                    f.write(b',' + item_start if job_count else item_start)
+                    f.write(encode(job))
+                    job_count += 1
+                f.write(array_end if job_count else b']')
+                
+                f.write(professionals_start)
+                for professional in professionals:
+                    f.write(b',' + item_start if professional_count else item_start)
+                    f.write(encode(professional))
+                    professional_count += 1
+                f.write(array_end if professional_count else b']')
+                
+                # The remaining fields are small and fixed, so they are encoded in
+                # one call and spliced in without their opening brace
+                metadata = orjson.dumps({
+                    'locations': self.film_locations,
+                    'categories': self.film_categories,
+                    'skills': self.film_skills,
+                    'scraped_at': datetime.now()
+                }, option=option)
+                f.write(b',')
+                f.write(metadata[1:])
+            # Temporary files are private; give the output the mode open() would
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(f.name, 0o666 & ~umask)
+            os.replace(f.name, filename)
+        except BaseException:
+            os.unlink(f.name)
+            raise
         
         print(f"Data saved to {filename}")
+        return job_count, professional_count
 
-    def run_scraper(self):
-        """Main scraping function"""
+    async def run_scraper(self, sample_size=3):
+        """Main scraping function
+
+        Jobs and professionals are streamed straight into the JSON file; only
+        the first sample_size of each are kept for display.
+        """
         print("Starting film industry data scraping...")
         
-        # Scrape jobs
-        print("Scraping film industry jobs...")
-        jobs = self.scrape_film_jobs()
-        print(f"Scraped {len(jobs)} jobs")
+        job_samples = []
+        
+        async def jobs():
+            async for job in self.scrape_film_jobs():
+                if len(job_samples) < sample_size:
+                    job_samples.append(job)
+                yield job
         
-        # Scrape professionals
-        print("Generating film professional profiles...")
         professionals = self.scrape_film_professionals()
-        print(f"Generated {len(professionals)} professional profiles")
+        professional_samples = list(itertools.islice(professionals, sample_size))
         
-        # Save to JSON
-        self.save_to_json(jobs, professionals)
+        # Scrape jobs and generate professionals while saving to JSON
+        print("Scraping film industry jobs and generating professional profiles...")
+        job_count, professional_count = await self.save_to_json(
+            jobs(), itertools.chain(professional_samples, professionals)
+        )
+        print(f"Scraped {job_count} jobs")
+        print(f"Generated {professional_count} professional profiles")
         
-        return jobs, professionals
+        return job_samples, professional_samples, job_count, professional_count
 
-if __name__ == "__main__":
+async def main():
     scraper = FilmIndustryDataScraper()
-    jobs, professionals = scraper.run_scraper()
+    try:
+        return await scraper.run_scraper()
+    finally:
+        await scraper.close()
+
+if __name__ == "__main__":
+    jobs, professionals, job_count, professional_count = asyncio.run(main())
     
     # Display sample data
     print("\n=== SAMPLE JOBS ===")
-    for i, job in enumerate(jobs[:3]):
+    for i, job in enumerate(jobs):
         print(f"\nJob {i+1}:")
-        print(f"Title: {job['title']}")
-        print(f"Location: {job['location']}")
-        print(f"Description: {job['description'][:100]}...")
-        print(f"Source: {job['source']}")
+        print(f"Title: {job.title}")
+        print(f"Location: {job.location}")
+        print(f"Description: {job.description[:100]}...")
+        print(f"Source: {job.source}")
     
     print("\n=== SAMPLE PROFESSIONALS ===")
-    for i, prof in enumerate(professionals[:3]):
+    for i, prof in enumerate(professionals):
         print(f"\nProfessional {i+1}:")
-        print(f"Name: {prof['firstName']} {prof['lastName']}")
-        print(f"Role: {prof['role']}")
-        print(f"Location: {prof['location']}")
-        print(f"Bio: {prof['bio'][:100]}...")
-        print(f"Skills: {', '.join(prof['skills'][:3])}...")
-        print(f"Experience: {prof['experience']}")
+        print(f"Name: {prof.firstName} {prof.lastName}")
+        print(f"Role: {prof.role}")
+        print(f"Location: {prof.location}")
+        print(f"Bio: {prof.bio[:100]}...")
+        print(f"Skills: {', '.join(prof.skills[:3])}...")
+        print(f"Experience: {prof.experience}")
     
-    print(f"\nTotal jobs scraped: {len(jobs)}")
-    print(f"Total professionals generated: {len(professionals)}")
+    print(f"\nTotal jobs scraped: {job_count}")
+    print(f"Total professionals generated: {professional_count}")
     print("Data saved to film_industry_data.json")